@@ -4,46 +4,118 @@
 from __future__ import annotations
 
 import argparse
-import collections.abc as C
-import typing as ty
 
 
-F = ty.TypeVar('F', bound=ty.Callable[..., ty.Any])
+# Same as typing.TYPE_CHECKING, but without importing typing at runtime, which
+# would add to the startup time of command line applications. Type checkers
+# treat any name TYPE_CHECKING as true.
+TYPE_CHECKING = False
 
 
-Decorator = ty.Callable[[F], F]
+if TYPE_CHECKING:
+    import typing as ty
 
+    F = ty.TypeVar('F', bound=ty.Callable[..., ty.Any])
 
-DecoratorFactory = ty.Callable[..., Decorator[F]]
+    Decorator = ty.Callable[[F], F]
 
+    DecoratorFactory = ty.Callable[..., Decorator[F]]
 
-AnyCallable = ty.Callable[..., ty.Any]
+    AnyCallable = ty.Callable[..., ty.Any]
 
+    AnyDecoratorFactory = DecoratorFactory[AnyCallable]
 
-AnyDecoratorFactory = DecoratorFactory[AnyCallable]
+    # A call to be replayed on the subparser of a command, as a tuple
+    # (method_name, args, kwargs).
+    SubparserCallDescriptor = ty.Tuple[
+        str,
+        ty.Tuple[ty.Any, ...],
+        ty.Dict[str, ty.Any],
+    ]
 
+    class SubparsersProtocol(ty.Protocol):
+        """
+        A protocol class to describe the returned value of
+        ``argparse.ArgumentParser.add_subparsers()``, since the official
+        documentation does not point to a public type for the returned
+        value.
+        """
+        def add_parser(self,
+            name: str,
+            **kw: ty.Any,
+        ) -> argparse.ArgumentParser:
+            ... # pragma: no cover
+
+
+class CommandDescriptor:
+    """
+    Data collected for a decorated function, used to create its subparser.
+    """
+    __slots__ = (
+        'name',
+        'fn',
+        'subparser_call_stack',
+        'append_call',
+        'add_parser_args',
+    )
+
+    def __init__(self, name: str, fn: AnyCallable):
+        self.name = name
+        self.fn = fn
+        self.subparser_call_stack: ty.List[SubparserCallDescriptor] = []
+        # Bound once here, as it is called for every stacked decorator.
+        self.append_call = self.subparser_call_stack.append
+        self.add_parser_args: ty.Optional[
+            ty.Tuple[ty.Sequence[ty.Any], ty.Dict[str, ty.Any]]
+        ] = None
+
+
+_EMPTY_KWARGS: ty.Dict[str, ty.Any] = {}
+"""
+Shared keyword arguments for subparser calls that have none. It is only ever
+unpacked, never modified.
+"""
+
+
+class _SubparserCall:
+    """
+    Decorator factory for a subparser method.
 
-class CommandDescriptor(ty.TypedDict):
-    name: ty.Optional[str]
-    fn: AnyCallable
-    subparser_call_stack: ty.List[SubparserCallDescriptor]
-    add_parser_args: ty.Optional[ty.Tuple[ty.Sequence[ty.Any],
-                                          ty.Dict[str, ty.Any]]]
+    Calling an instance of this class returns an ``_ArgDecorator`` that
+    registers the call on the decorated function's command.
+    """
+    __slots__ = ('get_command', 'method_name')
 
-class SubparserCallDescriptor(ty.TypedDict):
-    method_name: str
-    args: ty.Tuple[ty.Any, ...]
-    kwargs: ty.Dict[str, ty.Any]
+    def __init__(self,
+        get_command: ty.Callable[[AnyCallable], CommandDescriptor],
+        method_name: str,
+    ):
+        self.get_command = get_command
+        self.method_name = method_name
 
+    def __call__(self, *k: ty.Any, **kw: ty.Any) -> _ArgDecorator:
+        return _ArgDecorator(
+            self.get_command,
+            (self.method_name, k, kw or _EMPTY_KWARGS),
+        )
 
-class SubparsersProtocol(ty.Protocol):
+
+class _ArgDecorator:
     """
-    A protocol class to describe the returned value of
-    ``argparse.ArgumentParser.add_subparsers()``, since the official
-    documentation does not point to a public type for the returned value.
+    Decorator returned by ``_SubparserCall``.
     """
-    def add_parser(self, name: str, **kw: ty.Any) -> argparse.ArgumentParser:
-        ... # pragma: no cover
+    __slots__ = ('get_command', 'call')
+
+    def __init__(self,
+        get_command: ty.Callable[[AnyCallable], CommandDescriptor],
+        call: SubparserCallDescriptor,
+    ):
+        self.get_command = get_command
+        self.call = call
+
+    def __call__(self, fn: F) -> F:
+        self.get_command(fn).append_call(self.call)
+        return fn
 
 
 class SubDec:
@@ -94,6 +166,16 @@ class SubDec:
     foo-bar subcommand: 42
     """
 
+    # Private names are mangled by Python as usual.
+    __slots__ = (
+        '__commands',
+        '__name_prefix',
+        '__fn_dest',
+        '__sep',
+        '__decorator_factories',
+        '__weakref__',
+    )
+
     def __init__(self,
         name_prefix: str = '',
         fn_dest: str = 'fn',
@@ -113,11 +195,11 @@ class SubDec:
         replace the underscore character ("_") when converting the name of the
         decorated function to a subcommand name.
         """
-        self.__decorators_cache: ty.Dict[str, AnyDecoratorFactory] = {}
         self.__commands: ty.Dict[AnyCallable, CommandDescriptor] = {}
         self.__name_prefix = name_prefix
         self.__fn_dest = fn_dest
         self.__sep = sep
+        self.__decorator_factories: ty.Dict[str, AnyDecoratorFactory] = {}
 
     def create_parsers(self, subparsers: SubparsersProtocol) -> None:
         """
@@ -134,58 +216,83 @@ class SubDec:
         """
         def decorator(fn: F) -> F:
             cmd = self.__get_command(fn)
-            cmd['add_parser_args'] = (k, kw)
+            cmd.add_parser_args = (k, kw)
             return fn
         return decorator
 
-    def arg(self, *k: ty.Any, **kw: ty.Any) -> AnyDecoratorFactory:
+    def arg(self, *k: ty.Any, **kw: ty.Any) -> _ArgDecorator:
         """
         Alias for ``self.add_argument(*k, **kw)``.
         """
         return self.add_argument(*k, **kw)
 
+    def add_argument(self, *k: ty.Any, **kw: ty.Any) -> _ArgDecorator:
+        """
+        Decorator to call ``add_argument(*k, **kw)`` on the subparser.
+        """
+        return _ArgDecorator(
+            self.__get_command,
+            ('add_argument', k, kw or _EMPTY_KWARGS),
+        )
+
+    def add_argument_group(self, *k: ty.Any, **kw: ty.Any) -> _ArgDecorator:
+        """
+        Decorator to call ``add_argument_group(*k, **kw)`` on the subparser.
+        """
+        return _ArgDecorator(
+            self.__get_command,
+            ('add_argument_group', k, kw or _EMPTY_KWARGS),
+        )
+
+    def add_mutually_exclusive_group(self,
+        *k: ty.Any,
+        **kw: ty.Any,
+    ) -> _ArgDecorator:
+        """
+        Decorator to call ``add_mutually_exclusive_group(*k, **kw)`` on the
+        subparser.
+        """
+        return _ArgDecorator(
+            self.__get_command,
+            ('add_mutually_exclusive_group', k, kw or _EMPTY_KWARGS),
+        )
+
+    def set_defaults(self, *k: ty.Any, **kw: ty.Any) -> _ArgDecorator:
+        """
+        Decorator to call ``set_defaults(*k, **kw)`` on the subparser.
+        """
+        return _ArgDecorator(
+            self.__get_command,
+            ('set_defaults', k, kw or _EMPTY_KWARGS),
+        )
+
     def __getattr__(self, name: str) -> AnyDecoratorFactory:
-        if name in self.__decorators_cache:
-            return self.__decorators_cache[name]
-
-        def decorator_wrapper(*k: ty.Any, **kw: ty.Any) -> Decorator[F]:
-            def decorator(fn: F) -> F:
-                cmd = self.__get_command(fn)
-                cmd['subparser_call_stack'].append({
-                    'method_name': name,
-                    'args': k,
-                    'kwargs': kw,
-                })
-                return fn
-            return decorator
-
-        self.__decorators_cache[name] = decorator_wrapper
-        return decorator_wrapper
+        # Only reached for parser methods without a dedicated method above.
+        factories = self.__decorator_factories
+        factory = factories.get(name)
+        if factory is None:
+            factory = factories[name] = _SubparserCall(self.__get_command, name)
+        return factory
 
     def __get_command(self, fn: AnyCallable) -> CommandDescriptor:
-        if fn not in self.__commands:
-            self.__commands[fn] = {
-                'name': None,
-                'fn': fn,
-                'subparser_call_stack': [],
-                'add_parser_args': None,
-            }
-        return self.__commands[fn]
-
-    def __create_parser(self,
-                        cmd: CommandDescriptor,
-                        subparsers: SubparsersProtocol,
-                        ) -> None:
-        name = cmd['name']
-        if not name:
-            name = cmd['fn'].__name__
+        commands = self.__commands
+        cmd = commands.get(fn)
+        if cmd is None:
+            name = fn.__name__
             if name.startswith(self.__name_prefix):
                 name = name[len(self.__name_prefix):]
             if self.__sep is not None:
                 name = name.replace('_', self.__sep)
+            cmd = commands[fn] = CommandDescriptor(name, fn)
+        return cmd
 
-        if cmd['add_parser_args'] is not None:
-            add_parser_args, add_parser_kwargs = cmd['add_parser_args']
+    def __create_parser(self,
+                        cmd: CommandDescriptor,
+                        subparsers: SubparsersProtocol,
+                        ) -> None:
+        name = cmd.name
+        if cmd.add_parser_args is not None:
+            add_parser_args, add_parser_kwargs = cmd.add_parser_args
             if not add_parser_args:
                 add_parser_args = (name,)
         else:
@@ -193,8 +300,15 @@ class SubDec:
             add_parser_kwargs = {}
 
         parser = subparsers.add_parser(*add_parser_args, **add_parser_kwargs)
-        parser.set_defaults(**{self.__fn_dest: cmd['fn']})
-
-        for call_data in reversed(cmd['subparser_call_stack']):
-            method = getattr(parser, call_data['method_name'])
-            method(*call_data['args'], **call_data['kwargs'])
+        parser.set_defaults(**{self.__fn_dest: cmd.fn})
+
+        # Decorators are applied bottom-up, so replay the stack in reverse to
+        # get the calls in the order they appear in the source.
+        stack = cmd.subparser_call_stack
+        methods = {
+            method_name: getattr(parser, method_name)
+            for method_name in {call[0] for call in stack}
+        }
+        for i in range(len(stack) - 1, -1, -1):
+            method_name, args, kwargs = stack[i]
+            methods[method_name](*args, **kwargs)
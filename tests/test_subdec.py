@@ -1,4 +1,8 @@
 import argparse
+import typing as ty
+import weakref
+
+import pytest
 
 import argparse_subdec
 
@@ -78,3 +82,138 @@ def test_command_decorator() -> None:
         foo=True,
     )
     assert args == expected_args
+
+
+def test_other_parser_methods() -> None:
+    sd = argparse_subdec.SubDec()
+
+    @sd.set_defaults(value=42)
+    def foo() -> None:
+        pass
+
+    @sd.add_mutually_exclusive_group()
+    def with_group() -> None:
+        pass
+
+    # Names not known beforehand are still forwarded to the subparser.
+    @sd.register('type', 'upper', str.upper)
+    @sd.add_argument('value', type='upper')
+    def bar() -> None:
+        pass
+
+    # Factories created by __getattr__ are cached.
+    assert sd.register is sd.register
+
+    class GroupParser(argparse.ArgumentParser):
+        # Options cannot be added to the group through decorators, so add
+        # them here to check that the group was created.
+        def add_mutually_exclusive_group(self,
+            *,
+            required: bool = False,
+        ) -> argparse._MutuallyExclusiveGroup:
+            group = super().add_mutually_exclusive_group(required=required)
+            group.add_argument('--a', action='store_true')
+            group.add_argument('--b', action='store_true')
+            return group
+
+    parser = argparse.ArgumentParser()
+    subparsers = parser.add_subparsers(parser_class=GroupParser)
+    sd.create_parsers(subparsers)
+
+    args = parser.parse_args(['foo'])
+    expected_args = argparse.Namespace(
+        fn=foo,
+        value=42,
+    )
+    assert args == expected_args
+
+    args = parser.parse_args(['with-group', '--a'])
+    expected_args = argparse.Namespace(
+        fn=with_group,
+        a=True,
+        b=False,
+    )
+    assert args == expected_args
+
+    with pytest.raises(SystemExit):
+        parser.parse_args(['with-group', '--a', '--b'])
+
+    args = parser.parse_args(['bar', 'hello'])
+    expected_args = argparse.Namespace(
+        fn=bar,
+        value='HELLO',
+    )
+    assert args == expected_args
+
+
+def test_name_prefix_and_sep() -> None:
+    sd = argparse_subdec.SubDec(name_prefix='cmd_', sep='.')
+
+    @sd.cmd()
+    def cmd_foo_bar() -> None:
+        pass
+
+    @sd.cmd(help='no prefix to remove')
+    def without_prefix() -> None:
+        pass
+
+    # The name is taken when the function is first decorated.
+    @sd.arg('--option')
+    def cmd_renamed_later() -> None:
+        pass
+    cmd_renamed_later.__name__ = 'cmd_new_name'
+
+    parser = argparse.ArgumentParser()
+    subparsers = parser.add_subparsers()
+    sd.create_parsers(subparsers)
+
+    args = parser.parse_args(['foo.bar'])
+    expected_args = argparse.Namespace(
+        fn=cmd_foo_bar,
+    )
+    assert args == expected_args
+
+    args = parser.parse_args(['without.prefix'])
+    expected_args = argparse.Namespace(
+        fn=without_prefix,
+    )
+    assert args == expected_args
+
+    args = parser.parse_args(['renamed.later'])
+    expected_args = argparse.Namespace(
+        fn=cmd_renamed_later,
+        option=None,
+    )
+    assert args == expected_args
+
+
+def test_weakref() -> None:
+    sd = argparse_subdec.SubDec()
+    assert weakref.ref(sd)() is sd
+
+
+def test_subclass_override() -> None:
+    class CustomSubDec(argparse_subdec.SubDec):
+        def add_argument(self,
+            *k: ty.Any,
+            **kw: ty.Any,
+        ) -> argparse_subdec.subdec._ArgDecorator:
+            kw.setdefault('default', 'custom')
+            return super().add_argument(*k, **kw)
+
+    sd = CustomSubDec()
+
+    @sd.add_argument('--option')
+    def foo() -> None:
+        pass
+
+    parser = argparse.ArgumentParser()
+    subparsers = parser.add_subparsers()
+    sd.create_parsers(subparsers)
+
+    args = parser.parse_args(['foo'])
+    expected_args = argparse.Namespace(
+        fn=foo,
+        option='custom',
+    )
+    assert args == expected_args